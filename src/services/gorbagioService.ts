@@ -42,6 +42,12 @@ interface GorbagioApiResponse {
   data?: GorbagioApiItem[];
 }
 
+interface GorbagioCollectionStats {
+  floorPrice_SOL?: number;
+  volumeAll_SOL?: number;
+  listedCount?: number;
+}
+
 const normalizeWhitespace = (value?: string): string => {
   return value ? value.replace(/\s+/g, ' ').trim() : '';
 };
@@ -50,8 +56,35 @@ const normalizeWhitespace = (value?: string): string => {
 let _isUsingCachedData = false;
 export const isUsingCachedData = (): boolean => _isUsingCachedData;
 
-// Fetch Gorbagios data — live API first, local JSON fallback
+// Cache for the Gorbagio list so concurrent/repeat callers share one download
+let gorbagiosCache: { data: GorbagioApiResponse; timestamp: number } | null = null;
+let gorbagiosLoading: Promise<GorbagioApiResponse> | null = null;
+const CACHE_TTL = 5 * 60_000; // 5 minutes
+
+// Fetch Gorbagios data — served from cache when fresh, otherwise one shared in-flight request
 const fetchGorbagios = async (): Promise<GorbagioApiResponse> => {
+  if (gorbagiosCache && Date.now() - gorbagiosCache.timestamp < CACHE_TTL) {
+    return gorbagiosCache.data;
+  }
+  if (gorbagiosLoading) return gorbagiosLoading;
+
+  gorbagiosLoading = (async () => {
+    try {
+      const response = await loadGorbagios();
+      // Only cache successful loads so a transient failure is retried next call
+      if (response.success) {
+        gorbagiosCache = { data: response, timestamp: Date.now() };
+      }
+      return response;
+    } finally {
+      gorbagiosLoading = null;
+    }
+  })();
+  return gorbagiosLoading;
+};
+
+// Load Gorbagios data — live API first, local JSON fallback
+const loadGorbagios = async (): Promise<GorbagioApiResponse> => {
   // Try live API first
   try {
     const response = await fetch(`${GORBAGIO_API_URL}/nfts/gorbagios`, {
@@ -114,16 +147,30 @@ const fetchGorbagios = async (): Promise<GorbagioApiResponse> => {
   }
 };
 
+// Fetch scraped collection stats; independent of the NFT list so callers can run both concurrently
+const fetchCollectionStats = async (): Promise<GorbagioCollectionStats | null> => {
+  try {
+    const statsResponse = await fetch('/data/gorbagios_collection_stats.json');
+    if (statsResponse.ok) {
+      return await statsResponse.json();
+    }
+  } catch (error) {
+    console.warn('Could not fetch collection stats, using fallback');
+  }
+  return null;
+};
+
 const getSupplyFromResponse = (response: GorbagioApiResponse): number => {
   if (typeof response.total === 'number') return response.total;
   if (typeof response.count === 'number') return response.count;
   return response.data?.length ?? 0;
 };
 
-const buildGorbagioCollection = async (
+const buildGorbagioCollection = (
   response: GorbagioApiResponse,
+  stats: GorbagioCollectionStats | null,
   fallback?: Partial<Collection>
-): Promise<Collection> => {
+): Collection => {
   const items = response.data ?? [];
   const first = items[0];
   const supply = getSupplyFromResponse(response);
@@ -137,21 +184,15 @@ const buildGorbagioCollection = async (
   const image = first?.metadata?.image || fallback?.image || '';
   const banner = fallback?.banner || image;
 
-  // Try to fetch collection stats from scraped data
+  // Prefer scraped collection stats when available
   let floorPrice = fallback?.floorPrice ?? 0;
   let totalVolume = fallback?.totalVolume ?? 0;
   let listedCount = items.length ? listedFromApi : fallback?.listedCount ?? 0;
 
-  try {
-    const statsResponse = await fetch('/data/gorbagios_collection_stats.json');
-    if (statsResponse.ok) {
-      const stats = await statsResponse.json();
-      floorPrice = stats.floorPrice_SOL || floorPrice;
-      totalVolume = stats.volumeAll_SOL || totalVolume;
-      listedCount = stats.listedCount || listedCount;
-    }
-  } catch (error) {
-    console.warn('Could not fetch collection stats, using fallback');
+  if (stats) {
+    floorPrice = stats.floorPrice_SOL || floorPrice;
+    totalVolume = stats.volumeAll_SOL || totalVolume;
+    listedCount = stats.listedCount || listedCount;
   }
 
   return {
@@ -204,8 +245,8 @@ const mapGorbagioNFTs = (
 export const getGorbagioCollection = async (
   fallback?: Partial<Collection>
 ): Promise<Collection> => {
-  const response = await fetchGorbagios();
-  return await buildGorbagioCollection(response, fallback);
+  const [response, stats] = await Promise.all([fetchGorbagios(), fetchCollectionStats()]);
+  return buildGorbagioCollection(response, stats, fallback);
 };
 
 export const getGorbagioNFTs = async (options?: {
@@ -235,8 +276,8 @@ export const getGorbagioCollectionWithNFTs = async (options?: {
   limit?: number;
   offset?: number;
 }): Promise<{ collection: Collection; nfts: NFT[]; total: number }> => {
-  const response = await fetchGorbagios();
-  const collection = await buildGorbagioCollection(response, options?.collectionFallback);
+  const [response, stats] = await Promise.all([fetchGorbagios(), fetchCollectionStats()]);
+  const collection = buildGorbagioCollection(response, stats, options?.collectionFallback);
   const nfts = mapGorbagioNFTs(response.data ?? [], {
     collectionId: collection.id,
     collectionName: collection.name,